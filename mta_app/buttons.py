@@ -4,7 +4,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from typing import Optional
-from queue import SimpleQueue
+from queue import Empty, SimpleQueue
 
 from gpiozero import Button
 
@@ -54,3 +54,10 @@ class Buttons:
             return self.q.get_nowait()
         except Exception:
             return None
+
+    def get_event(self, timeout: Optional[float] = None) -> Optional[ButtonEvent]:
+        """Block until a button event arrives (or timeout elapses -> None)."""
+        try:
+            return self.q.get(timeout=timeout)
+        except Empty:
+            return None
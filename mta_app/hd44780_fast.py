@@ -0,0 +1,153 @@
+# mta_app/hd44780_fast.py
+from __future__ import annotations
+
+import struct
+import time
+from typing import Iterable, Tuple
+
+from smbus2 import SMBus, i2c_msg
+
+# PCF8574 backpack wiring (common "LCM1602" style boards):
+#   P0=RS  P1=RW  P2=EN  P3=backlight  P4..P7=D4..D7
+RS = 0x01
+RW = 0x02
+EN = 0x04
+BL = 0x08
+
+# HD44780 commands
+_CMD_CLEAR = 0x01
+_CMD_ENTRY_MODE = 0x06       # increment, no shift
+_CMD_DISPLAY_ON = 0x0C       # display on, cursor off, blink off
+_CMD_DISPLAY_OFF = 0x08
+_CMD_FUNCTION_SET = 0x28     # 4-bit, 2 lines, 5x8 font
+_CMD_SET_CGRAM = 0x40
+_CMD_SET_DDRAM = 0x80
+
+# DDRAM start address of each row on a 20x4 module
+ROW_OFFSETS = (0x00, 0x40, 0x14, 0x54)
+
+
+def _nibble(data: int, rs: int) -> bytes:
+    """
+    One 4-bit transfer: data lines go out together with EN high, then EN drops
+    (the controller latches on the falling edge, so a full I2C byte time covers the
+    data setup). RS must already be at `rs` before this; see _set_rs.
+    """
+    x = (data & 0xF0) | BL | rs
+    return bytes((x | EN, x))
+
+
+# One full byte = two nibbles = 4 expander bytes: [hi|EN, hi, lo|EN, lo]
+_PACK4 = struct.Struct("4B").pack_into
+
+
+def _set_rs(buf: bytearray, i: int, rs: int) -> int:
+    """
+    Write one expander byte with EN low that only sets RS. RS has to be stable
+    before EN rises (tAS), which can't happen in the same output update, so this
+    goes wherever RS may change: before every command or data block.
+    Returns the offset just past it.
+    """
+    buf[i] = BL | rs
+    return i + 1
+
+
+def _pack(buf: bytearray, i: int, data: Iterable[int], rs: int) -> int:
+    """
+    Pack each byte of data into buf at offset i as 4 expander bytes.
+    Returns the offset just past the last byte written.
+    """
+    flags = BL | rs
+    for b in data:
+        hi = (b & 0xF0) | flags
+        lo = ((b << 4) & 0xF0) | flags
+        _PACK4(buf, i, hi | EN, hi, lo | EN, lo)
+        i += 4
+    return i
+
+
+class Hd44780Pcf8574:
+    """
+    Minimal write-only HD44780 driver over a PCF8574 I2C backpack.
+
+    Only what the UI needs: cursor positioning, raw byte writes and CGRAM loads.
+    Every public call is a single i2c_rdwr transaction.
+    """
+
+    def __init__(self, port: int = 1, address: int = 0x27, cols: int = 20, rows: int = 4):
+        self.address = address
+        self.cols = cols
+        self.rows = rows
+        self._bus = SMBus(port)
+
+    # -------------------- LOW LEVEL --------------------
+
+    def _send(self, buf: bytes) -> None:
+        self._bus.i2c_rdwr(i2c_msg.write(self.address, buf))
+
+    def _command(self, value: int) -> None:
+        buf = bytearray(5)
+        _pack(buf, _set_rs(buf, 0, 0), (value,), 0)
+        self._send(buf)
+
+    # -------------------- PUBLIC --------------------
+
+    def init(self) -> None:
+        time.sleep(0.05)
+        # Reset into 8-bit mode three times, then switch to 4-bit (datasheet fig. 24)
+        self._send(_nibble(0x30, 0))
+        time.sleep(0.0045)
+        self._send(_nibble(0x30, 0))
+        time.sleep(0.00015)
+        self._send(_nibble(0x30, 0))
+        self._send(_nibble(0x20, 0))
+
+        self._command(_CMD_FUNCTION_SET)
+        self._command(_CMD_DISPLAY_OFF)
+        self.clear()
+        self._command(_CMD_ENTRY_MODE)
+        self._command(_CMD_DISPLAY_ON)
+
+    def clear(self) -> None:
+        self._command(_CMD_CLEAR)
+        time.sleep(0.002)  # clear takes ~1.5 ms
+
+    def set_cursor(self, row: int, col: int) -> None:
+        self._command(_CMD_SET_DDRAM | (ROW_OFFSETS[row] + col))
+
+    def write_bytes(self, data: bytes) -> None:
+        buf = bytearray(1 + len(data) * 4)
+        _pack(buf, _set_rs(buf, 0, RS), data, RS)
+        self._send(buf)
+
+    def write_runs(self, runs: Iterable[Tuple[int, int, bytes]]) -> None:
+        """
+        Write several (row, col, data) runs back-to-back in a single I2C transfer:
+        each run is a set-DDRAM command followed by its character bytes.
+        """
+        runs = list(runs)
+        if not runs:
+            return
+        # per run: RS setup + command (5) and RS setup + 4 per character
+        buf = bytearray(sum(6 + 4 * len(data) for _row, _col, data in runs))
+        i = 0
+        for row, col, data in runs:
+            i = _set_rs(buf, i, 0)
+            i = _pack(buf, i, (_CMD_SET_DDRAM | (ROW_OFFSETS[row] + col),), 0)
+            i = _set_rs(buf, i, RS)
+            i = _pack(buf, i, data, RS)
+        self._send(buf)
+
+    def create_chars(self, slot0_bytes: bytes) -> None:
+        """
+        Load custom glyphs starting at CGRAM slot 0 (8 bytes per glyph, up to 8 glyphs).
+        The CGRAM address auto-increments, so all glyphs go out in one transfer.
+        """
+        buf = bytearray(6 + 4 * len(slot0_bytes))
+        i = _pack(buf, _set_rs(buf, 0, 0), (_CMD_SET_CGRAM,), 0)
+        i = _set_rs(buf, i, RS)
+        _pack(buf, i, slot0_bytes, RS)
+        self._send(buf)
+
+    def close(self) -> None:
+        self._bus.close()
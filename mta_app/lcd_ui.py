@@ -1,13 +1,80 @@
 from __future__ import annotations
 
+import functools
+import re
+import threading
 import time
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
-
-from RPLCD.i2c import CharLCD
-
-
-@dataclass
+from typing import Dict, List, Optional, Tuple
+
+from mta_app.hd44780_fast import Hd44780Pcf8574
+
+@functools.lru_cache(maxsize=512)
+def _pad(s: str, width: int) -> str:
+    # Most lines are literals or repeat between frames, so cache the padded result
+    return s.ljust(width)[:width]
+
+
+# Clock text for the current minute: [minute start (epoch s), "HH:MM"]
+_HHMM_CACHE = [-1, ""]
+
+
+def _hhmm() -> str:
+    """
+    time.strftime("%H:%M"), reformatted only when the minute rolls over.
+    """
+    t = int(time.time())
+    m = t - (t % 60)
+    if m != _HHMM_CACHE[0]:
+        _HHMM_CACHE[:] = [m, time.strftime("%H:%M", time.localtime(m))]
+    return _HHMM_CACHE[1]
+
+
+# Weather kind keyword -> custom char (4 sun, 6 rain, 7 snow; anything else is 5 cloud)
+_WX_MAP = {
+    "sun": chr(4),
+    "clear": chr(4),
+    "snow": chr(7),
+    "sleet": chr(7),
+    "rain": chr(6),
+    "shower": chr(6),
+    "drizzle": chr(6),
+    "storm": chr(6),
+}
+_WX_RE = re.compile("|".join(_WX_MAP))
+
+# Settings sub-pages that are a title + two body lines + clock/status row.
+# key -> (title, line2, line3); "{0}" placeholders are filled from the render args.
+# Literal lines are padded to 20 columns here so rendering them is free.
+_STATIC_PAGES = {
+    key: tuple(line if "{" in line else line.ljust(20)[:20] for line in lines)
+    for key, lines in {
+        "ip": ("IP address:", "IP: {0}", "Left: Back"),
+        "buffer": ("Leave buffer:", "{0:2d} min before train", "Up/Down change"),
+        "about": ("About:", "Project by", "Ronish Nadar"),
+        "web": ("Select stations:", "Open:", "{0}"),
+        "wifi_empty": ("Wi Fi:", "No networks", "Left: Back"),
+    }.items()
+}
+
+# 5x8 custom glyphs, one byte per pixel row
+_UP = bytes((0b00100, 0b01110, 0b10101, 0b00100, 0b00100, 0b00100, 0b00100, 0b00000))
+_DOWN = bytes((0b00100, 0b00100, 0b00100, 0b00100, 0b00100, 0b10101, 0b01110, 0b00100))
+_HEART = bytes((0b00000, 0b01010, 0b11111, 0b11111, 0b11111, 0b01110, 0b00100, 0b00000))
+_HOME = bytes((0b00100, 0b01110, 0b11111, 0b10101, 0b10101, 0b10101, 0b11111, 0b00000))
+
+# Simple weather icons
+_SUN = bytes((0b00100, 0b10101, 0b01110, 0b11111, 0b01110, 0b10101, 0b00100, 0b00000))
+_CLOUD = bytes((0b00000, 0b00000, 0b01110, 0b11111, 0b11111, 0b11111, 0b01110, 0b00000))
+_RAIN = bytes((0b00000, 0b01110, 0b11111, 0b11111, 0b11111, 0b10101, 0b01010, 0b00000))
+_SNOW = bytes((0b00000, 0b01010, 0b00100, 0b11111, 0b00100, 0b01010, 0b00000, 0b00000))
+
+# CGRAM payloads, streamed from slot 0 in one transfer
+_NAV_CGRAM = _UP + _DOWN + _HEART + _HOME
+_HOME_CGRAM = _NAV_CGRAM + _SUN + _CLOUD + _RAIN + _SNOW
+
+
+@dataclass(frozen=True, slots=True)
 class PageData:
     stop_name: str
     direction: str
@@ -19,36 +86,73 @@ class LCDUI:
     COLS = 20
     ROWS = 4
 
+    _BLANK20 = " " * 20
+    _BLANK16 = " " * 16
+    _GAP4 = " " * 4  # marquee gap between end of text and its restart
+    _MARQUEE_CACHE_MAX = 16
+
+    # Settings menu: fixed labels x (selected / not selected) -> prebuilt padded lines
+    _MENU_ITEMS = ("IP address", "Wi Fi", "Select stations", "Leave buffer", "About")
+    _MENU_LINES = {
+        (sel, i): (("> " if sel else "  ") + label).ljust(20)[:20]
+        for i, label in enumerate(_MENU_ITEMS)
+        for sel in (False, True)
+    }
+
     def __init__(self, i2c_port: int = 1, i2c_address: int = 0x27):
-        self.lcd = CharLCD(
-            i2c_expander="PCF8574",
-            address=i2c_address,
+        self.lcd = Hd44780Pcf8574(
             port=i2c_port,
+            address=i2c_address,
             cols=self.COLS,
             rows=self.ROWS,
-            charmap="A00",
-            auto_linebreaks=False,
         )
-        self.lcd.clear()
-
-        # Cache previous lines to avoid rewriting the LCD constantly (I2C is slow)
-        self._last_lines = [""] * self.ROWS
+        self.lcd.init()
+
+        # Mirror of DDRAM (row-major, COLS bytes per row) so only changed cells are
+        # rewritten (I2C is slow). The display is blank right after init().
+        # Owned by the flush thread.
+        self._shadow = bytearray(b" " * (self.COLS * self.ROWS))
+
+        # Renderers only produce frames; a background thread pushes them over I2C so
+        # the UI loop never waits on the bus. Single slot: if frames arrive faster
+        # than the bus drains them, only the newest one is sent.
+        self._frame = bytes(self._shadow)  # last frame handed to the flush thread
+        self._pending_frame: Optional[bytes] = None
+        self._pending_cgram: Optional[bytes] = None
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._stop = threading.Event()
 
         # Station-name marquee state
         self._marquee_offset = 0
         self._last_marquee_tick = 0.0
 
+        # Marquee scroll buffers keyed by source text (bounded, oldest dropped first)
+        self._marquee_cache: Dict[str, str] = {}
+
         # Home weather-text marquee state (separate)
         self._home_weather_offset = 0
         self._home_weather_last_tick = 0.0
 
+        # Inputs of the last rendered frame; a renderer called again with the same
+        # inputs returns before formatting anything
+        self._last_frame_sig: Optional[tuple] = None
+        # Raw lines of the last frame; an identical set skips padding and encoding
+        self._last_lines: Tuple[str, ...] = ()
+
         # Track which set of custom chars is loaded (CGRAM has only 8 slots)
         self._charset_mode: Optional[str] = None
 
         # Default to normal UI charset
         self._load_charset_nav()
 
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+
     def close(self) -> None:
+        self._stop.set()
+        self._flush_event.set()
+        self._flush_thread.join(timeout=2.0)
         try:
             self.lcd.clear()
         finally:
@@ -65,34 +169,7 @@ class LCDUI:
         if self._charset_mode == "nav":
             return
         self._charset_mode = "nav"
-
-        up = [
-            0b00100, 0b01110, 0b10101, 0b00100,
-            0b00100, 0b00100, 0b00100, 0b00000,
-        ]
-        down = [
-            0b00100, 0b00100, 0b00100, 0b00100,
-            0b00100, 0b10101, 0b01110, 0b00100,
-        ]
-        heart = [
-            0b00000, 0b01010, 0b11111, 0b11111,
-            0b11111, 0b01110, 0b00100, 0b00000,
-        ]
-        home = [
-            0b00100,
-            0b01110,
-            0b11111,
-            0b10101,
-            0b10101,
-            0b10101,
-            0b11111,
-            0b00000,
-        ]
-
-        self.lcd.create_char(0, up)
-        self.lcd.create_char(1, down)
-        self.lcd.create_char(2, heart)
-        self.lcd.create_char(3, home)
+        self._queue_cgram(_NAV_CGRAM)
 
     def _load_charset_home(self) -> None:
         """
@@ -103,113 +180,120 @@ class LCDUI:
         if self._charset_mode == "home":
             return
         self._charset_mode = "home"
+        self._queue_cgram(_HOME_CGRAM)
+
+    def _queue_cgram(self, payload: bytes) -> None:
+        with self._flush_lock:
+            self._pending_cgram = payload
+        self._flush_event.set()
+
+    # -------------------- FLUSH THREAD --------------------
+
+    def _flush_loop(self) -> None:
+        failing = False
+        while not self._stop.is_set():
+            self._flush_event.wait()
+            self._flush_event.clear()
+            try:
+                self._flush_once()
+                failing = False
+            except Exception as e:
+                # keep thread alive: _flush_once put the unsent frame/glyphs back in the
+                # pending slots, so retry after a pause instead of spinning on a dead bus
+                if not failing:
+                    print(f"[LCD] I2C write failed, retrying: {e}")
+                    failing = True
+                if not self._stop.wait(0.5):
+                    self._flush_event.set()
+
+    def _flush_once(self) -> None:
+        with self._flush_lock:
+            frame, self._pending_frame = self._pending_frame, None
+            cgram, self._pending_cgram = self._pending_cgram, None
 
-        up = [
-            0b00100, 0b01110, 0b10101, 0b00100,
-            0b00100, 0b00100, 0b00100, 0b00000,
-        ]
-        down = [
-            0b00100, 0b00100, 0b00100, 0b00100,
-            0b00100, 0b10101, 0b01110, 0b00100,
-        ]
-        heart = [
-            0b00000, 0b01010, 0b11111, 0b11111,
-            0b11111, 0b01110, 0b00100, 0b00000,
-        ]
-        home = [
-            0b00100,
-            0b01110,
-            0b11111,
-            0b10101,
-            0b10101,
-            0b10101,
-            0b11111,
-            0b00000,
-        ]
-
-        # Simple 5x8 weather icons
-        sun = [
-            0b00100,
-            0b10101,
-            0b01110,
-            0b11111,
-            0b01110,
-            0b10101,
-            0b00100,
-            0b00000,
-        ]
-        cloud = [
-            0b00000,
-            0b00000,
-            0b01110,
-            0b11111,
-            0b11111,
-            0b11111,
-            0b01110,
-            0b00000,
-        ]
-        rain = [
-            0b00000,
-            0b01110,
-            0b11111,
-            0b11111,
-            0b11111,
-            0b10101,
-            0b01010,
-            0b00000,
-        ]
-        snow = [
-            0b00000,
-            0b01010,
-            0b00100,
-            0b11111,
-            0b00100,
-            0b01010,
-            0b00000,
-            0b00000,
-        ]
-
-        self.lcd.create_char(0, up)
-        self.lcd.create_char(1, down)
-        self.lcd.create_char(2, heart)
-        self.lcd.create_char(3, home)
-        self.lcd.create_char(4, sun)
-        self.lcd.create_char(5, cloud)
-        self.lcd.create_char(6, rain)
-        self.lcd.create_char(7, snow)
+        try:
+            if cgram is not None:
+                self.lcd.create_chars(cgram)
+                cgram = None
+            if frame is not None:
+                self._send_frame(frame)
+        except Exception:
+            # Renderers already consider these sent, so nothing would queue them again:
+            # restore whatever did not reach the display unless something newer replaced it
+            with self._flush_lock:
+                if self._pending_cgram is None:
+                    self._pending_cgram = cgram
+                if self._pending_frame is None:
+                    self._pending_frame = frame
+            raise
+
+    def _send_frame(self, frame: bytes) -> None:
+        cols = self.COLS
+        shadow = self._shadow
+
+        # Collect runs of changed cells; runs never cross rows since DDRAM rows are
+        # not contiguous. A single unchanged cell between two changes is rewritten
+        # rather than starting a new run: resending it costs 4 bytes, less than the
+        # 6 of a new run's set-DDRAM command and its two RS setup bytes.
+        runs = []
+        for r in range(self.ROWS):
+            base = r * cols
+            if frame[base: base + cols] == shadow[base: base + cols]:
+                continue
+            c = 0
+            while c < cols:
+                if frame[base + c] == shadow[base + c]:
+                    c += 1
+                    continue
+                start = c
+                end = c + 1  # one past the last changed cell
+                c += 1
+                while c < cols and c - end <= 1:
+                    if frame[base + c] != shadow[base + c]:
+                        end = c + 1
+                    c += 1
+                runs.append((r, start, frame[base + start: base + end]))
+
+        if runs:
+            self.lcd.write_runs(runs)
+            shadow[:] = frame
 
     # -------------------- HELPERS --------------------
 
-    @staticmethod
-    def _pad(s: str, width: int) -> str:
-        return (s[:width] + (" " * width))[:width]
-
-    def _write_lines(self, lines: List[str]) -> None:
-        # Normalize to exactly 4 padded lines
-        norm = [self._pad(lines[i], self.COLS) for i in range(self.ROWS)]
-
-        # Write only lines that changed
-        for r in range(self.ROWS):
-            if norm[r] != self._last_lines[r]:
-                self.lcd.cursor_pos = (r, 0)
-                self.lcd.write_string(norm[r])
-                self._last_lines[r] = norm[r]
+    def _write_lines(self, lines: List[str], sig: Optional[tuple] = None) -> None:
+        self._last_frame_sig = sig
+        # Tuple compare checks identity first, so repeated/cached strings cost a pointer test
+        key = tuple(lines[: self.ROWS])
+        if key == self._last_lines:
+            return
+        self._last_lines = key
 
-    def _marquee_18(self, text: str, tick_s: float = 0.35) -> str:
-        now = time.time()
-        if len(text) <= 18:
-            self._marquee_offset = 0
-            return self._pad(text, 18)
+        cols = self.COLS
+        frame = "".join([_pad(lines[r], cols) for r in range(self.ROWS)]).encode(
+            "latin-1", errors="replace"
+        )
+        if frame == self._frame:
+            return
 
-        if now - self._last_marquee_tick >= tick_s:
-            self._last_marquee_tick = now
-            self._marquee_offset = (self._marquee_offset + 1) % (len(text) + 4)
+        # Hand the frame to the flush thread (replacing any frame not yet sent)
+        self._frame = frame
+        with self._flush_lock:
+            self._pending_frame = frame
+        self._flush_event.set()
 
-        gap = " " * 4
-        scroll_text = text + gap
-        start = self._marquee_offset
-        window = (scroll_text + scroll_text)[start: start + 18]
-        return window
+    def _scroll_buffer(self, text: str) -> str:
+        """
+        (text + gap) twice, built once per distinct text, so any marquee window
+        (offset < len(text + gap), width < len(text)) is a single slice.
+        """
+        buf = self._marquee_cache.get(text)
+        if buf is None:
+            if len(self._marquee_cache) >= self._MARQUEE_CACHE_MAX:
+                # dicts keep insertion order: drop the oldest entry
+                del self._marquee_cache[next(iter(self._marquee_cache))]
+            buf = (text + self._GAP4) * 2
+            self._marquee_cache[text] = buf
+        return buf
 
     def _marquee_window(
         self,
@@ -227,7 +311,7 @@ class LCDUI:
         now = time.time()
         if len(text) <= width:
             setattr(self, offset_attr, 0)
-            return self._pad(text, width)
+            return _pad(text, width)
 
         last = getattr(self, last_attr)
         if now - last >= tick_s:
@@ -235,11 +319,8 @@ class LCDUI:
             off = getattr(self, offset_attr)
             setattr(self, offset_attr, (off + 1) % (len(text) + 4))
 
-        gap = " " * 4
-        scroll_text = text + gap
         start = getattr(self, offset_attr)
-        window = (scroll_text + scroll_text)[start: start + width]
-        return window
+        return self._scroll_buffer(text)[start: start + width]
 
     @staticmethod
     def _arrow_char(direction: str) -> str:
@@ -259,14 +340,8 @@ class LCDUI:
         Maps weather kind -> custom char.
         slots: 4 sun, 5 cloud, 6 rain, 7 snow
         """
-        k = (kind or "").lower()
-        if "sun" in k or "clear" in k:
-            return chr(4)
-        if "snow" in k or "sleet" in k:
-            return chr(7)
-        if "rain" in k or "shower" in k or "drizzle" in k or "storm" in k:
-            return chr(6)
-        return chr(5)
+        m = _WX_RE.search((kind or "").lower())
+        return _WX_MAP[m.group(0)] if m else chr(5)
 
     # -------------------- RENDERERS --------------------
 
@@ -290,13 +365,6 @@ class LCDUI:
         """
         self._load_charset_home()
 
-        def put(line: List[str], col1: int, s: str) -> None:
-            i = col1 - 1
-            for ch in s:
-                if 0 <= i < 20:
-                    line[i] = ch
-                i += 1
-
         def fmt_signed2(v: Optional[float]) -> str:
             """
             Always returns 3 characters:
@@ -321,11 +389,7 @@ class LCDUI:
         unit = "F" if unit == "F" else "C"
 
         # ---------- row 1 ----------
-        row1 = list(" " * 20)
-
         icon = self._weather_icon_kind(weather_kind)
-        put(row1, 1, icon)   # col1
-        put(row1, 2, " ")    # col2 blank so text starts at col3
 
         cond = (weather_text or "-").strip()
         # Requirement: row1 col3..col10 (8 chars). Marquee if longer.
@@ -336,47 +400,56 @@ class LCDUI:
             offset_attr="_home_weather_offset",
             last_attr="_home_weather_last_tick",
         )
-        put(row1, 3, cond8)
+        now = _hhmm()
+
+        sig = ("home", weather_kind, cond8, pop_pct, temp_val, feels_val, unit, leave_line, now)
+        if sig == self._last_frame_sig:
+            return
 
         # PoP starts at col12, with 4-space field for value
         if pop_pct is None:
             pop4 = "  --"
         else:
             pop4 = f"{int(pop_pct):02d}".rjust(4)  # "  01"
-        put(row1, 12, f"PoP:{pop4}%")
 
-        line1 = "".join(row1)
+        # icon@col1, text@col3..10, PoP@col12..20
+        line1 = f"{icon} {cond8} PoP:{pop4}%"
 
         # ---------- row 2 ----------
-        row2 = list(" " * 20)
-
         t3 = fmt_signed2(temp_val)
         f3 = fmt_signed2(feels_val)
 
-        put(row2, 1, "Temp.:")
-        put(row2, 7, t3)
-        put(row2, 10, unit)
-
-        put(row2, 12, "Feel:")
-        put(row2, 17, f3)
-        put(row2, 20, unit)
-
-        line2 = "".join(row2)
+        # Temp@col1..10, Feel@col12..20
+        line2 = f"Temp.:{t3}{unit} Feel:{f3}{unit}"
 
         # ---------- row 3 ----------
-        line3 = self._pad(leave_line or "", 20)
+        line3 = _pad(leave_line or "", 20)
 
         # ---------- row 4 ----------
-        now = time.strftime("%H:%M")
         home = self._home_char()
-        line4 = self._pad(now, 15) + self._pad(f"< {home} >", 5)
+        line4 = _pad(now, 15) + _pad(f"< {home} >", 5)
 
-        self._write_lines([line1, line2, line3, line4])
+        self._write_lines([line1, line2, line3, line4], sig)
 
     def render_station(self, data: PageData, page_idx: int, is_favorite: bool = False) -> None:
         self._load_charset_nav()
 
-        name18 = self._marquee_18(data.stop_name)
+        name18 = self._marquee_window(
+            data.stop_name,
+            18,
+            tick_s=0.35,
+            offset_attr="_marquee_offset",
+            last_attr="_last_marquee_tick",
+        )
+        now = _hhmm()
+
+        sig = (
+            "station", name18, data.direction, data.direction_label,
+            tuple(data.arrivals), page_idx, is_favorite, now,
+        )
+        if sig == self._last_frame_sig:
+            return
+
         arrow = self._arrow_char(data.direction)
         line1 = name18 + " " + arrow
 
@@ -388,117 +461,89 @@ class LCDUI:
                 route = (route or "?").strip()[:3]
                 left = f"{route}> {data.direction_label}"
                 right = ("--m" if eta is None else f"{eta}m").rjust(4)
-            return self._pad(left, 16) + right
+            return _pad(left, 16) + right
 
         line2 = fmt_line(0)
         line3 = fmt_line(1)
 
-        now = time.strftime("%H:%M")
         page_str = f"< {page_idx} >".rjust(5)
 
-        row4 = list(" " * 20)
-
-        for i, ch in enumerate(now[:5]):
-            row4[i] = ch
-
-        # Heart at col14 if favorite (index 13)
-        if is_favorite:
-            row4[13] = self._heart_char()
+        # time@col1..5, heart@col14 if favorite, page@col16..20
+        heart = self._heart_char() if is_favorite else " "
+        line4 = f"{now[:5]:<13}{heart} {page_str[-5:]}"
 
-        # Page at col16..20
-        page_part = page_str[-5:]
-        for i, ch in enumerate(page_part):
-            row4[15 + i] = ch
-
-        line4 = "".join(row4)
-
-        self._write_lines([line1, line2, line3, line4])
+        self._write_lines([line1, line2, line3, line4], sig)
 
     # -------- SETTINGS HUB + SUBPAGES --------
 
     def render_settings_landing(self, page_idx: int) -> None:
         self._load_charset_nav()
 
-        now = time.strftime("%H:%M")
+        now = _hhmm()
+        sig = ("landing", now)
+        if sig == self._last_frame_sig:
+            return
+
         heart = self._heart_char()
         page = f"< {heart} >".rjust(5)
 
         lines = [
-            self._pad("Settings:", 20),
-            self._pad("Press Select", 20),
-            self._pad("L/R: Pages", 20),
-            self._pad(now, 15) + self._pad(page, 5),
+            _pad("Settings:", 20),
+            _pad("Press Select", 20),
+            _pad("L/R: Pages", 20),
+            _pad(now, 15) + _pad(page, 5),
         ]
-        self._write_lines(lines)
+        self._write_lines(lines, sig)
 
     def render_settings_menu(self, selected_idx: int, page_idx: int) -> None:
         self._load_charset_nav()
 
-        items = ["IP address", "Wi Fi", "Select stations", "Leave buffer", "About"]
-        selected_idx = max(0, min(selected_idx, len(items) - 1))
+        n = len(self._MENU_ITEMS)
+        selected_idx = max(0, min(selected_idx, n - 1))
+
+        start = max(0, min(selected_idx - 1, n - 3))
+        now = _hhmm()
 
-        start = max(0, min(selected_idx - 1, len(items) - 3))
-        window = items[start: start + 3]
+        sig = ("menu", selected_idx, now)
+        if sig == self._last_frame_sig:
+            return
 
-        lines = [self._pad("Settings:", 20)]
-        for i, label in enumerate(window):
-            abs_idx = start + i
-            prefix = ">" if abs_idx == selected_idx else " "
-            lines.append(self._pad(f"{prefix} {label}", 20))
+        lines = [_pad("Settings:", 20)]
+        for abs_idx in range(start, start + 3):
+            lines.append(self._MENU_LINES[(abs_idx == selected_idx, abs_idx)])
 
-        now = time.strftime("%H:%M")
         heart = self._heart_char()
         page = f"< {heart} >".rjust(5)
-        lines.append(self._pad(now, 15) + self._pad(page, 5))
+        lines.append(_pad(now, 15) + _pad(page, 5))
 
-        self._write_lines(lines)
+        self._write_lines(lines, sig)
 
-    def render_ip_page(self, ip_address: str) -> None:
+    def _render_static(self, key: str, *args: object, bottom: str = "") -> None:
+        """
+        Title + two body lines from _STATIC_PAGES (templates filled from args),
+        bottom row = status text if given, else the clock.
+        """
         self._load_charset_nav()
 
-        now = time.strftime("%H:%M")
-        lines = [
-            self._pad("IP address:", 20),
-            self._pad(f"IP: {ip_address}", 20),
-            self._pad("Left: Back", 20),
-            self._pad(now, 20),
-        ]
-        self._write_lines(lines)
+        bottom = bottom or _hhmm()
+        sig = (key, args, bottom)
+        if sig == self._last_frame_sig:
+            return
+
+        title, line2, line3 = _STATIC_PAGES[key]
+        self._write_lines([title, line2.format(*args), line3.format(*args), bottom], sig)
+
+    def render_ip_page(self, ip_address: str) -> None:
+        self._render_static("ip", ip_address)
 
     def render_leave_buffer_page(self, buffer_min: int) -> None:
-        self._load_charset_nav()
-        now = time.strftime("%H:%M")
-        lines = [
-            self._pad("Leave buffer:", 20),
-            self._pad(f"{buffer_min:2d} min before train", 20),
-            self._pad("Up/Down change", 20),
-            self._pad(now, 20),
-        ]
-        self._write_lines(lines)
+        self._render_static("buffer", buffer_min)
 
     def render_about_page(self) -> None:
-        self._load_charset_nav()
-
-        now = time.strftime("%H:%M")
-        lines = [
-            self._pad("About:", 20),
-            self._pad("Project by", 20),
-            self._pad("Ronish Nadar", 20),
-            self._pad(now, 20),
-        ]
-        self._write_lines(lines)
+        self._render_static("about")
 
     def render_web_config_page(self, url: str) -> None:
-        self._load_charset_nav()
-
-        now = time.strftime("%H:%M")
-        lines = [
-            self._pad("Select stations:", 20),
-            self._pad("Open:", 20),
-            self._pad(url, 20),
-            self._pad(now, 20),
-        ]
-        self._write_lines(lines)
+        self._render_static("web", url)
 
     def render_wifi_list_page(
         self,
@@ -507,26 +552,24 @@ class LCDUI:
         selected_idx: int,
         status: str = "",
     ) -> None:
+        if not networks:
+            self._render_static("wifi_empty", bottom=status)
+            return
+
         self._load_charset_nav()
 
-        now = time.strftime("%H:%M")
+        now = _hhmm()
         bottom = status if status else now
 
-        if not networks:
-            lines = [
-                self._pad("Wi Fi:", 20),
-                self._pad("No networks", 20),
-                self._pad("Left: Back", 20),
-                self._pad(bottom, 20),
-            ]
-            self._write_lines(lines)
+        sig = ("wifi", tuple(networks), active_ssid, selected_idx, bottom)
+        if sig == self._last_frame_sig:
             return
 
         selected_idx = max(0, min(selected_idx, len(networks) - 1))
         start = max(0, min(selected_idx, len(networks) - 2))
         win = networks[start: start + 2]
 
-        lines = [self._pad("Wi Fi:", 20)]
+        lines = [_pad("Wi Fi:", 20)]
 
         for i in range(2):
             if i < len(win):
@@ -534,24 +577,28 @@ class LCDUI:
                 abs_idx = start + i
                 prefix = ">" if abs_idx == selected_idx else " "
                 mark = "*" if ssid == active_ssid and ssid else " "
-                lines.append(self._pad(f"{prefix}{mark} {ssid}", 20))
+                lines.append(_pad(f"{prefix}{mark} {ssid}", 20))
             else:
-                lines.append(" " * 20)
+                lines.append(self._BLANK20)
 
-        lines.append(self._pad(bottom, 20))
-        self._write_lines(lines)
+        lines.append(_pad(bottom, 20))
+        self._write_lines(lines, sig)
 
     def render_wifi_password_page(self, ssid: str, password: str, cursor: int) -> None:
         self._load_charset_nav()
 
+        sig = ("wifi_pass", ssid, password, cursor)
+        if sig == self._last_frame_sig:
+            return
+
         cursor = max(0, min(cursor, 15))
-        shown = (password + (" " * 16))[:16]
-        caret_line = " " * cursor + "^" + " " * (19 - cursor)
+        shown = (password + self._BLANK16)[:16]
+        caret_line = self._BLANK20[:cursor] + "^" + self._BLANK20[cursor + 1:]
 
         lines = [
-            self._pad(f"WiFi: {ssid}"[:20], 20),
-            self._pad(shown, 20),
-            self._pad(caret_line, 20),
-            self._pad("Sel=OK  L=Back", 20),
+            _pad(f"WiFi: {ssid}"[:20], 20),
+            _pad(shown, 20),
+            _pad(caret_line, 20),
+            _pad("Sel=OK  L=Back", 20),
         ]
-        self._write_lines(lines)
+        self._write_lines(lines, sig)
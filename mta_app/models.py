@@ -1,10 +1,10 @@
 # mta_app/models.py
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     poll_interval_sec: int
     print_limit: int
@@ -15,7 +15,7 @@ class AppConfig:
     favorite_station_index: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StationConfig:
     stop_name: str
     gtfs_stop_id: str
@@ -23,19 +23,20 @@ class StationConfig:
     direction_label: str
     feed: str
     run_for_sec: int
+    rt_stop_id: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def rt_stop_id(self) -> str:
-        return f"{self.gtfs_stop_id}{self.direction}"
+    def __post_init__(self) -> None:
+        # frozen: set the derived realtime stop id once instead of rebuilding it per access
+        object.__setattr__(self, "rt_stop_id", f"{self.gtfs_stop_id}{self.direction}")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     app: AppConfig
     stations: List[StationConfig]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Arrival:
     route_id: str
     trip_id: str
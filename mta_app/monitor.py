@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
 import requests
 
-from mta_app.mta_client import extract_arrivals, fetch_feed
+from mta_app.mta_client import extract_arrivals_multi, fetch_feed
 from mta_app.models import Settings, StationConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class StationSnapshot:
     # [(route_id, eta_min), ...] length 0..print_limit
     arrivals: List[Tuple[str, Optional[int]]]
@@ -29,13 +30,19 @@ class Monitor:
 
         # index stations by feed to reduce fetches
         self._stations_by_feed: Dict[str, List[Tuple[int, StationConfig]]] = {}
+        # per feed: rt_stop_id -> station indexes, so each feed is walked once per poll
+        self._stop_ids_by_feed: Dict[str, Dict[str, List[int]]] = {}
         for idx, st in enumerate(settings.stations):
             self._stations_by_feed.setdefault(st.feed, []).append((idx, st))
+            self._stop_ids_by_feed.setdefault(st.feed, {}).setdefault(st.rt_stop_id, []).append(idx)
 
         # init empty snapshots
         for i in range(len(settings.stations)):
             self._snapshots[i] = StationSnapshot(arrivals=[], last_ok_ts=0.0, last_error="")
 
+        # feeds are fetched concurrently; each request is network-bound
+        self._pool = ThreadPoolExecutor(max_workers=max(2, len(self._stations_by_feed)))
+
         self._thread = threading.Thread(target=self._run, daemon=True)
 
     def start(self) -> None:
@@ -45,6 +52,7 @@ class Monitor:
         self._stop.set()
         self._force_refresh.set()
         self._thread.join(timeout=2.0)
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     def force_refresh(self) -> None:
         self._force_refresh.set()
@@ -65,42 +73,47 @@ class Monitor:
                 # keep thread alive no matter what
                 pass
 
-            # wait for next cycle OR forced refresh OR stop
-            while True:
-                if self._stop.is_set():
-                    return
-                if self._force_refresh.is_set():
-                    self._force_refresh.clear()
-                    break
-                elapsed = time.time() - cycle_start
-                remaining = poll - elapsed
+            # wait for next cycle OR forced refresh OR stop (stop() also sets _force_refresh)
+            deadline = cycle_start + poll
+            while not self._stop.is_set():
+                remaining = deadline - time.time()
                 if remaining <= 0:
                     break
-                time.sleep(min(0.2, remaining))
+                if self._force_refresh.wait(timeout=remaining):
+                    self._force_refresh.clear()
+                    break
 
     def _poll_once(self, timeout_s: int) -> None:
-        # fetch each feed once, apply to all stations in that feed
-        for feed, items in self._stations_by_feed.items():
+        # fetch all feeds in parallel, apply each to all stations in that feed as it lands
+        futures = {
+            self._pool.submit(fetch_feed, feed, timeout_s): (feed, items)
+            for feed, items in self._stations_by_feed.items()
+        }
+        for fut in as_completed(futures):
             if self._stop.is_set():
                 return
+            feed, items = futures[fut]
             try:
-                msg = fetch_feed(feed, timeout_s=timeout_s)
+                msg = fut.result()
                 now = int(time.time())
-                for idx, st in items:
-                    arr = extract_arrivals(msg, st.rt_stop_id, now=now)
+                stop_ids = self._stop_ids_by_feed[feed]
+
+                limit = int(self.settings.app.print_limit)
+                if limit <= 0:
+                    limit = 2  # safety fallback
 
-                    limit = int(self.settings.app.print_limit)
-                    if limit <= 0:
-                        limit = 2  # safety fallback
+                by_stop = extract_arrivals_multi(msg, stop_ids, now=now, limit=limit)
 
-                    top = [(a.route_id, a.eta_min) for a in arr[:limit]]
+                for rt_stop_id, idxs in stop_ids.items():
+                    top = [(a.route_id, a.eta_min) for a in by_stop[rt_stop_id]]
 
                     with self._lock:
-                        self._snapshots[idx] = StationSnapshot(
-                            arrivals=top,
-                            last_ok_ts=time.time(),
-                            last_error="",
-                        )
+                        for idx in idxs:
+                            self._snapshots[idx] = StationSnapshot(
+                                arrivals=top,
+                                last_ok_ts=time.time(),
+                                last_error="",
+                            )
             except requests.RequestException as e:
                 err = f"Fetch error: {e}"
                 with self._lock:
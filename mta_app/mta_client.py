@@ -1,6 +1,8 @@
 from __future__ import annotations
+import heapq
 import time
-from typing import List, Optional
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import requests
 from google.transit import gtfs_realtime_pb2
@@ -8,13 +10,25 @@ from google.transit import gtfs_realtime_pb2
 from mta_app.feeds import FEEDS
 from mta_app.models import Arrival
 
+# Shared keep-alive session: polls reuse the open TLS connection instead of
+# handshaking with the MTA endpoint every cycle.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
-def fetch_feed(feed_name: str, timeout_s: int) -> gtfs_realtime_pb2.FeedMessage:
-    url = FEEDS[feed_name]
-    r = requests.get(url, timeout=timeout_s)
+
+def fetch_feed(
+    feed_name: str,
+    timeout_s: int,
+    _feeds=FEEDS,
+    _FeedMessage=gtfs_realtime_pb2.FeedMessage,
+    _get=_SESSION.get,
+) -> gtfs_realtime_pb2.FeedMessage:
+    # Leading-underscore args bind module lookups as fast locals; not for callers.
+    url = _feeds[feed_name]
+    r = _get(url, timeout=timeout_s)
     r.raise_for_status()
 
-    msg = gtfs_realtime_pb2.FeedMessage()
+    msg = _FeedMessage()
     msg.ParseFromString(r.content)
     return msg
 
@@ -23,41 +37,66 @@ def extract_arrivals(
     msg: gtfs_realtime_pb2.FeedMessage,
     stop_id: str,
     now: Optional[int] = None,
+    limit: Optional[int] = None,
 ) -> List[Arrival]:
+    return extract_arrivals_multi(msg, (stop_id,), now=now, limit=limit)[stop_id]
+
+
+def extract_arrivals_multi(
+    msg: gtfs_realtime_pb2.FeedMessage,
+    stop_ids: Iterable[str],
+    now: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, List[Arrival]]:
+    """
+    Arrivals for several stops from a single walk over the feed.
+    Returns {stop_id: arrivals sorted by eta} with an entry for every requested stop,
+    each cut to the first `limit` arrivals if given.
+    """
     now = int(time.time()) if now is None else now
-    out: List[Arrival] = []
+    # Collect plain (eta, route_id, trip_id) records during the walk; Arrival objects
+    # are only built for the rows that survive the sort + limit.
+    rows: Dict[str, List[Tuple[int, str, str]]] = {sid: [] for sid in stop_ids}
+    stale = now - 30
+    rows_get = rows.get
 
     for ent in msg.entity:
         if not ent.HasField("trip_update"):
             continue
 
         tu = ent.trip_update
-        route_id = tu.trip.route_id if tu.HasField("trip") else ""
-        trip_id = tu.trip.trip_id if tu.HasField("trip") else ""
+        # trip is required on a GTFS-RT TripUpdate; unset scalars read as "" / 0
+        trip = tu.trip
+        route_id = trip.route_id or "?"
+        trip_id = trip.trip_id
 
         for stu in tu.stop_time_update:
-            if stu.stop_id != stop_id:
+            bucket = rows_get(stu.stop_id)
+            if bucket is None:
                 continue
 
-            eta = None
-            if stu.HasField("arrival") and stu.arrival.time:
-                eta = int(stu.arrival.time)
-            elif stu.HasField("departure") and stu.departure.time:
-                eta = int(stu.departure.time)
-
-            if eta is None:
-                continue
-            if eta < now - 30:  # ignore stale
+            eta = int(stu.arrival.time or stu.departure.time)
+            if not eta or eta < stale:  # no prediction, or stale
                 continue
 
-            out.append(
-                Arrival(
-                    route_id=route_id or "?",
-                    trip_id=trip_id or "",
-                    eta_epoch=eta,
-                    eta_min=max(0, int(round((eta - now) / 60.0))),
-                )
-            )
+            bucket.append((eta, route_id, trip_id))
 
-    out.sort(key=lambda a: a.eta_epoch)
+    out: Dict[str, List[Arrival]] = {}
+    for sid, bucket in rows.items():
+        if limit is not None and limit < len(bucket) // 4:
+            # only the first few are shown; a partial heap select beats a full sort
+            bucket = heapq.nsmallest(limit, bucket, key=itemgetter(0))
+        else:
+            bucket.sort(key=itemgetter(0))
+            if limit is not None:
+                del bucket[limit:]
+        out[sid] = [
+            Arrival(
+                route_id=route_id,
+                trip_id=trip_id,
+                eta_epoch=eta,
+                eta_min=max(0, int(round((eta - now) / 60.0))),
+            )
+            for eta, route_id, trip_id in bucket
+        ]
     return out
@@ -36,21 +36,17 @@ def run_monitor(settings: Settings) -> None:
         while True:
             cycle_start = time.time()
 
-            # If the app has a finite duration, stop when all stations have ended
-            active = 0
+            # Poll every station still running; stop once all of them have ended
+            any_active = False
             for st in settings.stations:
                 end_t = station_end_times[st.stop_name]
-                if end_t == 0 or time.time() < end_t:
-                    active += 1
-            if active == 0:
-                print("All station timers completed. Exiting.")
-                return
-
-            for st in settings.stations:
-                end_t = station_end_times[st.stop_name]
-                if end_t != 0 and time.time() >= end_t:
+                if end_t != 0 and cycle_start >= end_t:
                     continue  # station finished
+                any_active = True
                 _print_station_once(st, settings)
+            if not any_active:
+                print("All station timers completed. Exiting.")
+                return
 
             # Sleep until the next poll boundary
             elapsed = time.time() - cycle_start
@@ -76,7 +72,7 @@ def _print_station_once(st: StationConfig, settings: Settings) -> None:
 
     try:
         msg = fetch_feed(st.feed, timeout_s=app.http_timeout_sec)
-        arrivals = extract_arrivals(msg, rt_stop_id)
+        arrivals = extract_arrivals(msg, rt_stop_id, limit=max(1, min(app.print_limit, 25)))
         print(format_arrivals(arrivals, limit=app.print_limit))
     except requests.RequestException as e:
         print(f"Fetch error: {e}")
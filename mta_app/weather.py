@@ -3,13 +3,22 @@ from __future__ import annotations
 
 import threading
 import time
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import requests
 
+try:
+    import orjson  # optional: faster JSON decode straight from bytes
+except ImportError:
+    orjson = None
 
-@dataclass
+# Keep-alive session so periodic refreshes reuse the connection to Open-Meteo
+_SESSION = requests.Session()
+
+
+@dataclass(slots=True)
 class WeatherSnapshot:
     condition_text: str          # e.g. "Sunny", "Cloudy"
     condition_kind: str          # one of: sunny/cloudy/rain/snow/fog/storm
@@ -21,70 +30,58 @@ class WeatherSnapshot:
 
 # Open-Meteo weather codes:
 # https://open-meteo.com/en/docs
-def _map_weathercode(code: Optional[int]) -> Tuple[str, str]:
-    if code is None:
-        return ("-", "cloudy")
-
+_CODE_MAP: Dict[int, Tuple[str, str]] = {
     # Clear
-    if code == 0:
-        return ("Clear", "sunny")
-    if code in (1, 2):
-        return ("Partly cloudy", "cloudy")
-    if code == 3:
-        return ("Overcast", "cloudy")
-
+    0: ("Clear", "sunny"),
+    1: ("Partly cloudy", "cloudy"),
+    2: ("Partly cloudy", "cloudy"),
+    3: ("Overcast", "cloudy"),
     # Fog
-    if code in (45, 48):
-        return ("Fog", "fog")
-
+    45: ("Fog", "fog"),
+    48: ("Fog", "fog"),
     # Drizzle / rain
-    if code in (51, 53, 55):
-        return ("Drizzle", "rain")
-    if code in (56, 57):
-        return ("Freezing drizzle", "snow")
-
-    if code in (61, 63, 65):
-        return ("Rain", "rain")
-    if code in (66, 67):
-        return ("Freezing rain", "snow")
-
+    51: ("Drizzle", "rain"),
+    53: ("Drizzle", "rain"),
+    55: ("Drizzle", "rain"),
+    56: ("Freezing drizzle", "snow"),
+    57: ("Freezing drizzle", "snow"),
+    61: ("Rain", "rain"),
+    63: ("Rain", "rain"),
+    65: ("Rain", "rain"),
+    66: ("Freezing rain", "snow"),
+    67: ("Freezing rain", "snow"),
     # Snow
-    if code in (71, 73, 75):
-        return ("Snow", "snow")
-    if code == 77:
-        return ("Snow grains", "snow")
-
+    71: ("Snow", "snow"),
+    73: ("Snow", "snow"),
+    75: ("Snow", "snow"),
+    77: ("Snow grains", "snow"),
     # Showers
-    if code in (80, 81, 82):
-        return ("Showers", "rain")
-
+    80: ("Showers", "rain"),
+    81: ("Showers", "rain"),
+    82: ("Showers", "rain"),
     # Thunderstorm
-    if code in (95,):
-        return ("Thunderstorm", "storm")
-    if code in (96, 99):
-        return ("Thunderstorm", "storm")
+    95: ("Thunderstorm", "storm"),
+    96: ("Thunderstorm", "storm"),
+    99: ("Thunderstorm", "storm"),
+}
+
 
-    return ("Weather", "cloudy")
+def _map_weathercode(code: Optional[int]) -> Tuple[str, str]:
+    if code is None:
+        return ("-", "cloudy")
+    return _CODE_MAP.get(code, ("Weather", "cloudy"))
 
 
 def _nearest_hour_index(times: list[str], target_iso: str) -> int:
     """
-    times: list of ISO strings like "2026-02-17T02:00"
+    times: sorted list of ISO strings like "2026-02-17T02:00"
     target_iso: same format
-    Returns best index (exact if found, else closest by string compare).
+    Returns best index (exact if found, else first time after target, else last).
     """
-    # exact match first
-    try:
-        return times.index(target_iso)
-    except ValueError:
-        pass
-
-    # fallback: closest by lexical distance (ISO format sorts)
-    # find first time >= target
-    for i, t in enumerate(times):
-        if t >= target_iso:
-            return i
-    return max(0, len(times) - 1)
+    # ISO strings sort chronologically, so binary search works on the raw strings
+    if not times:
+        return 0
+    return min(bisect_left(times, target_iso), len(times) - 1)
 
 
 def fetch_weather_open_meteo(
@@ -109,9 +106,9 @@ def fetch_weather_open_meteo(
         "timezone": "auto",
     }
 
-    r = requests.get(url, params=params, timeout=timeout_s)
+    r = _SESSION.get(url, params=params, timeout=timeout_s)
     r.raise_for_status()
-    data = r.json()
+    data = orjson.loads(r.content) if orjson is not None else r.json()
 
     cw = data.get("current_weather") or {}
     code = cw.get("weathercode")
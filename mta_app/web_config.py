@@ -1,20 +1,68 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import sys
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import time
+from email.utils import formatdate
+from http import HTTPStatus
 from pathlib import Path
-from urllib.parse import parse_qs
+from typing import Tuple
+from urllib.parse import parse_qs, unquote_to_bytes
+
+try:
+    import simdjson  # optional: SIMD validation of the posted settings
+except ImportError:
+    simdjson = None
+
+try:
+    import uvloop  # optional: faster event loop for the config server
+except ImportError:
+    uvloop = None
 
 SETTINGS_PATH = Path("settings.json")
 
+# One parser reused across requests so its internal buffers are allocated once.
+# A Parser is not thread-safe, so requests take turns with it.
+_parser = simdjson.Parser() if simdjson is not None else None
+_parser_lock = threading.Lock()
+
 
 def _load_settings_text() -> str:
     return SETTINGS_PATH.read_text(encoding="utf-8")
 
 
-def _save_settings_text(text: str) -> None:
-    SETTINGS_PATH.write_text(text, encoding="utf-8")
+_save_lock = threading.Lock()
+
+
+def _save_settings_bytes(data: bytes) -> None:
+    # Write a temp file and rename it over settings.json, so readers (and a power cut)
+    # only ever see the old or the new file, never a half-written one.
+    data = memoryview(data)
+    tmp = f"{SETTINGS_PATH}.tmp"
+    with _save_lock:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, SETTINGS_PATH)
+
+
+def _validate_json(data: bytes) -> None:
+    """Raise ValueError if data is not valid UTF-8 JSON."""
+    if _parser is not None:
+        try:
+            with _parser_lock:
+                _parser.parse(data)
+            return
+        except ValueError:
+            pass  # fall through so the error message comes from json, as before
+    json.loads(data)
 
 
 HTML = """<!doctype html>
@@ -31,62 +79,157 @@ HTML = """<!doctype html>
 </html>
 """
 
-
-class Handler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        if self.path not in ("/", "/index.html"):
-            self.send_response(404)
-            self.end_headers()
-            return
-
-        try:
-            text = _load_settings_text()
-            page = HTML.format(json_text=text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;"))
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.end_headers()
-            self.wfile.write(page.encode("utf-8"))
-        except Exception as e:
-            self.send_response(500)
-            self.end_headers()
-            self.wfile.write(str(e).encode("utf-8"))
-
-    def do_POST(self):
-        if self.path != "/save":
-            self.send_response(404)
-            self.end_headers()
-            return
-
-        length = int(self.headers.get("Content-Length", "0"))
-        body = self.rfile.read(length).decode("utf-8", errors="replace")
-        form = parse_qs(body)
-        json_text = form.get("json", [""])[0]
-
-        try:
-            # validate JSON
-            json.loads(json_text)
-            _save_settings_text(json_text)
-            self.send_response(200)
-            self.send_header("Content-Type", "text/plain; charset=utf-8")
-            self.end_headers()
-            self.wfile.write(b"Saved. You can go back.")
-        except Exception as e:
-            self.send_response(400)
-            self.send_header("Content-Type", "text/plain; charset=utf-8")
-            self.end_headers()
-            self.wfile.write(f"Invalid JSON: {e}".encode("utf-8"))
+# Template split once around the textarea contents; no str.format per request
+_HTML_PREFIX, _HTML_SUFFIX = (part.encode("utf-8") for part in HTML.split("{json_text}"))
+
+# Single-pass HTML escape for the textarea contents
+_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Rendered config page, keyed on settings.json (mtime_ns, size); rebuilt only when the file changes
+_page_cache = {"key": None, "page": b""}
+_page_lock = threading.Lock()
+
+
+def _settings_page() -> bytes:
+    st = SETTINGS_PATH.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    with _page_lock:
+        if _page_cache["key"] != key:
+            escaped = _load_settings_text().translate(_ESCAPE).encode("utf-8")
+            _page_cache["page"] = _HTML_PREFIX + escaped + _HTML_SUFFIX
+            _page_cache["key"] = key
+        return _page_cache["page"]
+
+
+_TEXT = "text/plain; charset=utf-8"
+_HTML_TYPE = "text/html; charset=utf-8"
+
+
+def _response(status: int, body: bytes, content_type: str) -> bytes:
+    """Full HTTP response (status line + headers + body) as one buffer, so it goes out in one send."""
+    head = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Date: {formatdate(usegmt=True)}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def _get(path: str) -> Tuple[int, bytes, str]:
+    if path not in ("/", "/index.html"):
+        return 404, b"", _TEXT
+
+    try:
+        return 200, _settings_page(), _HTML_TYPE
+    except Exception as e:
+        return 500, str(e).encode("utf-8"), _TEXT
+
+
+async def _post(path: str, body: bytes) -> Tuple[int, bytes, str]:
+    if path != "/save":
+        return 404, b"", _TEXT
+
+    # Keep the posted settings as bytes end to end: validated and written as received.
+    if body.startswith(b"json=") and b"&" not in body:
+        # The page's form has just this one field: decode it directly
+        json_bytes = unquote_to_bytes(body[5:].replace(b"+", b" "))
+    else:
+        # Anything else goes through the generic parser. latin-1 maps bytes 1:1 to
+        # code points, so the field round-trips to the exact percent-decoded bytes
+        form = parse_qs(body.decode("latin-1"), encoding="latin-1")
+        json_bytes = form.get("json", [""])[0].encode("latin-1")
+
+    try:
+        _validate_json(json_bytes)
+        # fsync on an SD card can stall; keep it off the event loop
+        await asyncio.to_thread(_save_settings_bytes, json_bytes)
+        return 200, b"Saved. You can go back.", _TEXT
+    except Exception as e:
+        return 400, f"Invalid JSON: {e}".encode("utf-8"), _TEXT
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    One request per connection: request line, headers (only Content-Length is used),
+    optional body, then a single response and close.
+    """
+    try:
+        request_line = (await reader.readline()).rstrip(b"\r\n")
+        parts = request_line.split()
+        if len(parts) != 3:
+            return  # not HTTP; drop the connection
+
+        method, path = parts[0], parts[1].decode("latin-1")
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                length = int(value)
+
+        if method == b"GET":
+            status, body, content_type = _get(path)
+        elif method == b"POST":
+            status, body, content_type = await _post(path, await reader.readexactly(length))
+        else:
+            status, body, content_type = 501, b"", _TEXT
+
+        writer.write(_response(status, body, content_type))
+        await writer.drain()
+
+        peer = writer.get_extra_info("peername")
+        sys.stderr.write(
+            f"{peer[0] if peer else '-'} - - [{time.strftime('%d/%b/%Y %H:%M:%S')}] "
+            f'"{request_line.decode("latin-1")}" {status} -\n'
+        )
+    except (ValueError, ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass  # malformed request or client went away
+    finally:
+        writer.close()
 
 
 class WebConfigServer:
+    """
+    settings.json editor served from a single asyncio event loop (uvloop if installed)
+    on one background thread, instead of a thread per connection.
+    """
+
     def __init__(self, host: str = "0.0.0.0", port: int = 8088):
         self.host = host
         self.port = port
-        self._httpd = HTTPServer((host, port), Handler)
-        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        # Bind now so a busy port fails here, as HTTPServer did
+        self._server = self._loop.run_until_complete(asyncio.start_server(_handle, host, port))
+        self._thread = threading.Thread(target=self._serve, daemon=True)
 
     def start(self) -> None:
         self._thread.start()
 
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+        # Stopped: close the listener, cancel in-flight requests, release the loop
+        self._server.close()
+        tasks = asyncio.all_tasks(self._loop)
+        for t in tasks:
+            t.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        self._loop.close()
+
     def stop(self) -> None:
-        self._httpd.shutdown()
-        self._thread.join(timeout=2.0)
+        # Stopping the loop is just a scheduled callback; the serve thread tears down
+        # in well under the join timeout, so shutdown never waits on a poll interval.
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=0.5)
+        elif not self._loop.is_closed():
+            # never started: release the listening socket here
+            self._server.close()
+            self._loop.close()
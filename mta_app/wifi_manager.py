@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import functools
+import re
 import subprocess
+import time
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Callable, Dict, List, Tuple, Union
 
 
-def _run(cmd: List[str]) -> str:
-    out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True)
+def _run(cmd: List[str], text: bool = True) -> Union[str, bytes]:
+    # text=False hands back raw bytes for output that is only pattern-matched
+    out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=text)
     return out.strip()
 
 
+@functools.lru_cache(maxsize=1)  # nmcli doesn't appear or vanish while we run
 def has_nmcli() -> bool:
     try:
         _run(["nmcli", "-v"])
@@ -18,19 +23,62 @@ def has_nmcli() -> bool:
         return False
 
 
+def _ttl_cache(ttl: float, maxsize: int = 8) -> Callable:
+    """
+    Like functools.lru_cache, but entries expire ttl seconds after they were computed.
+    Keyed on positional args; the wrapper gets a cache_clear() for explicit invalidation.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        cache: Dict[tuple, Tuple[float, object]] = {}
+
+        @functools.wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if hit is not None and now < hit[0]:
+                return hit[1]
+            value = fn(*args)
+            if args not in cache and len(cache) >= maxsize:
+                # dicts keep insertion order: drop the oldest entry
+                del cache[next(iter(cache))]
+            cache[args] = (now + ttl, value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+# A radio rescan blocks for seconds; repeat scans within this window reuse the last one
+_RESCAN_MIN_INTERVAL_S = 10.0
+_last_rescan = 0.0
+
+
+# Line of the connected network in _nmcli_list output
+_ACTIVE_RE = re.compile(rb"^yes:(.*)$", re.M)
+
+
+@_ttl_cache(2.0)
+def _nmcli_list() -> bytes:
+    """
+    One b"ACTIVE:SSID" line per visible network, shared by get_active_ssid and
+    scan_ssids so back-to-back calls cost a single nmcli process.
+    """
+    # -e no: SSID is the last field, so colons in it needn't be escaped
+    return _run(["nmcli", "-t", "-e", "no", "-f", "ACTIVE,SSID", "dev", "wifi", "list"], text=False)
+
+
+@_ttl_cache(1.0)  # polled by the UI; a second of staleness is fine
 def get_active_ssid() -> str:
     """
     Returns currently connected SSID or "".
     """
     try:
-        # nmcli -t -f ACTIVE,SSID dev wifi
-        out = _run(["nmcli", "-t", "-f", "ACTIVE,SSID", "dev", "wifi"])
-        for line in out.splitlines():
-            # format: yes:MySSID
-            parts = line.split(":", 1)
-            if len(parts) == 2 and parts[0] == "yes":
-                return parts[1]
-        return ""
+        # format: yes:MySSID
+        m = _ACTIVE_RE.search(_nmcli_list())
+        return m.group(1).decode() if m else ""
     except Exception:
         return ""
 
@@ -39,27 +87,21 @@ def scan_ssids(limit: int = 20) -> List[str]:
     """
     Returns a list of nearby SSIDs (unique, non-empty).
     """
-    try:
-        # Force rescan
-        _run(["nmcli", "dev", "wifi", "rescan"])
-    except Exception:
-        pass
+    global _last_rescan
+    now = time.monotonic()
+    if not _last_rescan or now - _last_rescan > _RESCAN_MIN_INTERVAL_S:
+        try:
+            # Force rescan
+            _run(["nmcli", "dev", "wifi", "rescan"])
+            _nmcli_list.cache_clear()  # the cached list predates the rescan
+        except Exception:
+            pass
+        _last_rescan = now
 
     try:
-        out = _run(["nmcli", "-t", "-f", "SSID", "dev", "wifi", "list"])
-        ssids: List[str] = []
-        seen = set()
-        for line in out.splitlines():
-            ssid = line.strip()
-            if not ssid:
-                continue
-            if ssid in seen:
-                continue
-            seen.add(ssid)
-            ssids.append(ssid)
-            if len(ssids) >= limit:
-                break
-        return ssids
+        names = (line.split(":", 1)[-1].strip() for line in _nmcli_list().decode().splitlines())
+        # dict.fromkeys dedupes while keeping scan order
+        return list(dict.fromkeys(n for n in names if n))[:limit]
     except Exception:
         return []
 
@@ -71,6 +113,9 @@ def connect_wifi(ssid: str, password: str) -> Tuple[bool, str]:
     try:
         # This will create/update a connection profile
         _run(["nmcli", "dev", "wifi", "connect", ssid, "password", password])
+        # the active network just changed
+        _nmcli_list.cache_clear()
+        get_active_ssid.cache_clear()
         return True, "Connected"
     except subprocess.CalledProcessError as e:
         msg = e.output.strip() if e.output else "Connect failed"
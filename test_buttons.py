@@ -1,14 +1,13 @@
-import time
 from mta_app.buttons import Buttons
 
-btn = Buttons(debug=True)
+# Same BCM pins as app.py
+btn = Buttons(left_gpio=27, right_gpio=19, select_gpio=26, up_gpio=13, down_gpio=22)
 
 print("Press buttons (Ctrl+C to stop)...")
 try:
     while True:
-        ev = btn.pop_event()
-        if ev:
+        ev = btn.get_event(timeout=1.0)
+        if ev is not None:
             print(f"POP: {ev.kind} at {ev.t:.3f}")
-        time.sleep(0.02)
 except KeyboardInterrupt:
     pass